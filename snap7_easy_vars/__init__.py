@@ -1,3 +1,5 @@
+from .batch import PLCRequestBatcher
 from .connection import PLCConnection
 from .data import PLCData
 from .fields import PLCBoolField, PLCRealField, PLCWordField
+from .pool import PLCConnectionPool
@@ -0,0 +1,160 @@
+import asyncio
+import ctypes
+import logging
+
+from snap7.type import Area, S7DataItem, WordLen
+
+logger = logging.getLogger(__name__)
+
+
+class PLCRequestBatcher:
+    """
+    Coalesces concurrent read/write requests against one PLC into single
+    multi-item S7 requests.
+
+    Individual ``PLCConnection.read``/``write`` calls each pay a full S7 PDU
+    round trip. The batcher buffers requests arriving within a short linger
+    window and flushes them with ``read_multi_vars``/``write_multi_vars``,
+    so N concurrent requests cost one round trip instead of N.
+    """
+
+    def __init__(self, connection, *, linger_ms: float = 5, max_batch: int = 16):
+        self.connection = connection
+        self.linger_ms = float(linger_ms)
+        self.max_batch = int(max_batch)
+        # Created lazily in _submit(): asyncio.Queue() binds the current
+        # loop eagerly on Python 3.9, and batchers are naturally built
+        # before the loop starts
+        self._queue = None
+        self._flusher: asyncio.Task | None = None
+
+    async def read(self, data_store, db_number=None) -> bool:
+        """
+        Queue a read of ``data_store`` (from ``db_number``, defaulting to the
+        connection's DB) and wait for the batched result.
+        """
+        return await self._submit("read", data_store, db_number)
+
+    async def write(self, data_store, db_number=None) -> bool:
+        """
+        Queue a write of ``data_store`` and wait for the batched result.
+        """
+        return await self._submit("write", data_store, db_number)
+
+    async def _submit(self, op, data_store, db_number) -> bool:
+        if db_number is None:
+            db_number = self.connection.db_number
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((op, data_store, db_number, future))
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.ensure_future(self._flush_loop())
+        return await future
+
+    async def _flush_loop(self):
+        while not self._queue.empty():
+            batch = [self._queue.get_nowait()]
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + self.linger_ms / 1000.0
+            while len(batch) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            await self._flush(batch)
+
+    async def _flush(self, batch):
+        reads = [entry for entry in batch if entry[0] == "read"]
+        writes = [entry for entry in batch if entry[0] == "write"]
+        try:
+            read_payloads, write_results = await asyncio.to_thread(
+                self._execute, reads, writes
+            )
+        except Exception as e:
+            logger.error(f"Error executing batched PLC request: {e}")
+            for _, _, _, future in batch:
+                if not future.done():
+                    future.set_result(False)
+            return
+
+        for (_, data_store, db_number, future), payload in zip(reads, read_payloads):
+            if payload is not None:
+                data_store.from_bytes(payload)
+            if not future.done():
+                future.set_result(payload is not None)
+        for (_, _, _, future), ok in zip(writes, write_results):
+            if not future.done():
+                future.set_result(ok)
+
+    def _execute(self, reads, writes):
+        """
+        Blocking half of a flush; runs in a worker thread. Returns the raw
+        payload (or None) per read and a success flag per write.
+        """
+        read_payloads = [None] * len(reads)
+        write_results = [False] * len(writes)
+        if not self.connection.connect():
+            return read_payloads, write_results
+
+        if reads:
+            # Deduplicate reads of the same DB so each DB is fetched once
+            db_numbers = []
+            for _, data_store, db_number, _ in reads:
+                if db_number not in db_numbers:
+                    db_numbers.append(db_number)
+            sizes = {}
+            for _, data_store, db_number, _ in reads:
+                size = data_store.buffer_size()
+                sizes[db_number] = max(sizes.get(db_number, 0), size)
+
+            items = (S7DataItem * len(db_numbers))()
+            buffers = []
+            for i, db_number in enumerate(db_numbers):
+                buffer = (ctypes.c_uint8 * sizes[db_number])()
+                buffers.append(buffer)
+                items[i].Area = ctypes.c_int32(Area.DB)
+                items[i].WordLen = ctypes.c_int32(WordLen.Byte)
+                items[i].DBNumber = ctypes.c_int32(db_number)
+                items[i].Start = ctypes.c_int32(0)
+                items[i].Amount = ctypes.c_int32(sizes[db_number])
+                items[i].pData = ctypes.cast(buffer, ctypes.POINTER(ctypes.c_uint8))
+            try:
+                self.connection.client.read_multi_vars(items)
+            except Exception as e:
+                logger.error(f"Error reading batched data from PLC: {e}")
+            else:
+                payload_by_db = {
+                    db_number: bytes(buffers[i])
+                    for i, db_number in enumerate(db_numbers)
+                    if items[i].Result == 0
+                }
+                for idx, (_, _, db_number, _) in enumerate(reads):
+                    read_payloads[idx] = payload_by_db.get(db_number)
+
+        if writes:
+            items = (S7DataItem * len(writes))()
+            buffers = []
+            for i, (_, data_store, db_number, _) in enumerate(writes):
+                data = data_store.to_bytes()
+                buffer = (ctypes.c_uint8 * len(data)).from_buffer_copy(data)
+                buffers.append(buffer)
+                items[i].Area = ctypes.c_int32(Area.DB)
+                items[i].WordLen = ctypes.c_int32(WordLen.Byte)
+                items[i].DBNumber = ctypes.c_int32(db_number)
+                items[i].Start = ctypes.c_int32(0)
+                items[i].Amount = ctypes.c_int32(len(data))
+                items[i].pData = ctypes.cast(buffer, ctypes.POINTER(ctypes.c_uint8))
+            try:
+                # write_multi_vars copies the items, so per-item Result codes
+                # are not reflected back; treat the batch as all-or-nothing
+                self.connection.client.write_multi_vars(list(items))
+            except Exception as e:
+                logger.error(f"Error writing batched data to PLC: {e}")
+            else:
+                write_results = [True] * len(writes)
+
+        return read_payloads, write_results
@@ -1,20 +1,46 @@
+import asyncio
 import snap7
-from datetime import datetime
+import os
+import time
 import socket
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def _apply_low_latency_options(sock: socket.socket):
+    """
+    Tune a TCP socket for the S7 request/response pattern.
+
+    TCP_NODELAY disables Nagle's algorithm, which otherwise adds ~100-150 ms
+    of latency to every small request/response round trip. SO_KEEPALIVE lets
+    the OS detect dead peers on idle connections.
+    """
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    # Linux-only keepalive tuning; silently skipped on other platforms
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60)
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10)
+    if hasattr(socket, "TCP_KEEPCNT"):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+
+
 class PLCConnection:
     """
     A class to talk with S7 PLC.
     """
 
+    # How long after a successful S7 operation the connection is trusted
+    # without re-probing get_connected(); SO_KEEPALIVE still catches sockets
+    # that die while idle longer than this
+    FRESHNESS_WINDOW = 2.0  # seconds
+
     def __init__(
         self,
         ip_address,
-        data_store,
+        data_store=None,
         db_number=1,
         rack=0,
         slot=1,
@@ -30,14 +56,7 @@ class PLCConnection:
         self.connect_timeout = float(connect_timeout)
         self.client = snap7.client.Client()
         self.data_store = data_store
-
-    def notify_subscribers(self):
-        """Forward notifications to the underlying data store subscribers."""
-        try:
-            self.data_store.notify_subscribers()
-        except Exception:
-            # Keep defensive; notification should never block connection flow
-            pass
+        self._last_ok_mono = None
 
     def connect(self):
         """
@@ -58,7 +77,7 @@ class PLCConnection:
                 (self.ip_address, self.port), timeout=self.connect_timeout
             ) as s:
                 # Successful low-level TCP connect; proceed with snap7 handshake
-                pass
+                _apply_low_latency_options(s)
         except Exception as e:
             logger.error(
                 f"Timeout/error while establishing TCP connection to PLC {self.ip_address}:{self.port} within {self.connect_timeout:.1f}s: {e}"
@@ -71,61 +90,140 @@ class PLCConnection:
             logger.error(f"PLC connection error: {e}")
             return False
 
-        self.data_store.last_connected = datetime.now()
+        self._tune_client_socket()
+
+        if self.data_store is not None:
+            self.data_store.mark_connected()
         logger.info("Connected to PLC.")
         return True
 
-    def read(self):
+    def _tune_client_socket(self):
         """
-        Reads the data from the PLC.
+        Best-effort: locate the TCP socket snap7 opened to the PLC and apply
+        the low-latency options. snap7 does not expose its file descriptor,
+        so scan our open descriptors for a socket connected to the PLC port.
+        Failures here are harmless; the connection works either way.
         """
-        # Establish connection if needed; avoid db_read on disconnected client
         try:
-            connected = self.client.get_connected()
+            for fd in range(3, 256):
+                try:
+                    dup_fd = os.dup(fd)
+                except OSError:
+                    continue
+                try:
+                    sock = socket.socket(fileno=dup_fd)
+                except OSError:
+                    os.close(dup_fd)
+                    continue
+                try:
+                    peer = sock.getpeername()
+                    if isinstance(peer, tuple) and peer[1] == self.port:
+                        _apply_low_latency_options(sock)
+                except OSError:
+                    pass
+                finally:
+                    sock.close()
         except Exception as e:
-            logger.error(f"Error while checking PLC connection state: {e}")
-            connected = False
+            logger.debug(f"Could not tune PLC socket options: {e}")
+
+    def read(self, data_store=None, db_number=None):
+        """
+        Reads the data from the PLC into ``data_store`` (defaults to the one
+        bound at construction time, likewise ``db_number``).
+        """
+        if data_store is None:
+            data_store = self.data_store
+        if data_store is None:
+            raise ValueError(
+                "read() needs a data_store (none bound to this connection)"
+            )
+        if db_number is None:
+            db_number = self.db_number
+        # Establish connection if needed; avoid db_read on disconnected client
+        connected = self._is_fresh()
+        if not connected:
+            try:
+                connected = self.client.get_connected()
+            except Exception as e:
+                logger.error(f"Error while checking PLC connection state: {e}")
+                connected = False
 
         if not connected:
             if not self.connect():
-                self.connect()
                 # Not connected, skip read this cycle
                 return False
         try:
-            byte_amount = self.data_store.buffer_size()
-            data = self.client.db_read(self.db_number, 0, byte_amount)
+            byte_amount = data_store.buffer_size()
+            data = self.client.db_read(db_number, 0, byte_amount)
         except Exception as e:
             logger.error(f"Error reading data from PLC: {e}")
+            self._last_ok_mono = None
             return False
 
-        self.data_store.from_bytes(data)
-        self.data_store.last_connected = datetime.now()
+        self._last_ok_mono = time.monotonic()
+        # db_read returned exactly buffer_size() bytes; skip the length guards
+        data_store.from_bytes_unchecked(data)
+        data_store.mark_connected()
 
         return True
 
-    def write(self):
+    def write(self, data_store=None, db_number=None):
         """
         Writes the result and finished back to the PLC.
         """
-        new_bytes = self.data_store.to_bytes()
+        if data_store is None:
+            data_store = self.data_store
+        if data_store is None:
+            raise ValueError(
+                "write() needs a data_store (none bound to this connection)"
+            )
+        if db_number is None:
+            db_number = self.db_number
+        new_bytes = data_store.to_bytes()
         # Establish connection if needed; avoid db_write on disconnected client
-        try:
-            connected = self.client.get_connected()
-        except Exception as e:
-            logger.error(f"Error while checking PLC connection state: {e}")
-            connected = False
-            return False
+        connected = self._is_fresh()
+        if not connected:
+            try:
+                connected = self.client.get_connected()
+            except Exception as e:
+                logger.error(f"Error while checking PLC connection state: {e}")
+                return False
 
         if not connected:
             if not self.connect():
                 return False
 
         try:
-            self.client.db_write(self.db_number, 0, new_bytes)
+            self.client.db_write(db_number, 0, new_bytes)
         except Exception as e:
             logger.error(f"Error writing data to PLC: {e}")
+            self._last_ok_mono = None
             return False
 
-        self.data_store.last_connected = datetime.now()
+        self._last_ok_mono = time.monotonic()
+        data_store.mark_connected()
 
         return True
+
+    def _is_fresh(self) -> bool:
+        """True when a recent successful S7 op makes a liveness probe redundant."""
+        return (
+            self._last_ok_mono is not None
+            and time.monotonic() - self._last_ok_mono <= self.FRESHNESS_WINDOW
+        )
+
+    async def aconnect(self) -> bool:
+        """
+        Async variant of connect(). The preflight TCP probe and the snap7
+        handshake block for up to connect_timeout; run them in a worker
+        thread so the event loop stays responsive.
+        """
+        return await asyncio.to_thread(self.connect)
+
+    async def aread(self, data_store=None, db_number=None) -> bool:
+        """Async variant of read(); the S7 round trip runs in a worker thread."""
+        return await asyncio.to_thread(self.read, data_store, db_number)
+
+    async def awrite(self, data_store=None, db_number=None) -> bool:
+        """Async variant of write(); the S7 round trip runs in a worker thread."""
+        return await asyncio.to_thread(self.write, data_store, db_number)
@@ -1,45 +1,226 @@
 import asyncio
-from collections import OrderedDict
-from datetime import datetime
-from typing import Dict, List, Optional
-from .fields import PLCField
+import struct
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+from .fields import PLCBoolField, PLCField
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+class PLCDataSubscription:
+    """
+    Handle returned by :meth:`PLCData.subscribe`. Await :meth:`get` to block
+    until the data store has changed since this subscription last saw it.
+    """
+
+    def __init__(self, data_store):
+        self._data_store = data_store
+        self._seen = data_store._rev
+
+    async def get(self):
+        data_store = self._data_store
+        while self._seen == data_store._rev:
+            await data_store._update_event.wait()
+        self._seen = data_store._rev
+        return data_store
+
+
 class PLCDataMeta(type):
     """
     Metaclass collecting PLC field descriptors in definition order.
     """
 
     def __new__(mcls, name, bases, namespace):
-        fields = OrderedDict()
+        # Plain dict preserves insertion order on Python 3.7+ and iterates
+        # faster than OrderedDict
+        fields = {}
 
         for base in bases:
             base_fields = getattr(base, "_fields", None)
             if base_fields:
                 fields.update(base_fields)
 
+        declared_slots = []
         for attr_name, attr_value in list(namespace.items()):
             if isinstance(attr_value, PLCField):
                 attr_value.name = attr_name
+                attr_value.slot_name = "_v_" + attr_name
                 fields[attr_name] = attr_value
+                declared_slots.append("_v_" + attr_name)
+
+        # One __slots__ entry per field declared in this class body gives
+        # C-level value storage instead of a per-instance dict
+        namespace["__slots__"] = tuple(namespace.get("__slots__", ())) + tuple(
+            declared_slots
+        )
 
         namespace["_fields"] = fields
+        namespace["_buffer_size"] = (
+            max(field.byte_offset + field.size for field in fields.values())
+            if fields
+            else 0
+        )
+        mcls._build_struct(namespace, fields)
+        mcls._generate_serializers(namespace, fields)
         return super().__new__(mcls, name, bases, namespace)
 
+    @staticmethod
+    def _build_struct(namespace, fields):
+        """
+        Precompile one big-endian struct.Struct covering all scalar fields so
+        from_bytes/to_bytes can (de)serialize them in a single C call instead
+        of one Python-level descriptor call per field.
+        """
+        scalars = sorted(
+            (field for field in fields.values() if field.struct_format),
+            key=lambda field: field.byte_offset,
+        )
+        bools = tuple(
+            field for field in fields.values() if isinstance(field, PLCBoolField)
+        )
+
+        if len(scalars) + len(bools) != len(fields):
+            # Custom field types the struct cannot express; the per-field
+            # fallback must handle every field, fast paths included
+            namespace["_struct"] = None
+            namespace["_struct_names"] = ()
+            namespace["_struct_slots"] = ()
+            namespace["_bool_fields"] = bools
+            namespace["_bool_reset_bytes"] = ()
+            return
+
+        fmt = ">"
+        position = 0
+        for field in scalars:
+            if field.byte_offset < position:
+                # Overlapping scalars; leave the per-field fallback in charge
+                namespace["_struct"] = None
+                namespace["_struct_names"] = ()
+                namespace["_struct_slots"] = ()
+                namespace["_bool_fields"] = bools
+                namespace["_bool_reset_bytes"] = ()
+                return
+            if field.byte_offset > position:
+                fmt += f"{field.byte_offset - position}x"
+            fmt += field.struct_format
+            position = field.byte_offset + field.size
+
+        namespace["_struct"] = struct.Struct(fmt) if scalars else None
+        namespace["_struct_names"] = tuple(field.name for field in scalars)
+        namespace["_struct_slots"] = tuple(field.slot_name for field in scalars)
+        namespace["_bool_fields"] = bools
+        # Bool bytes beyond the struct span keep stale bits when the transmit
+        # buffer is reused; they must be zeroed before the bit ORs
+        namespace["_bool_reset_bytes"] = tuple(
+            sorted(
+                {field.byte_offset for field in bools if field.byte_offset >= position}
+            )
+        )
+
+    @staticmethod
+    def _generate_serializers(namespace, fields):
+        """
+        Emit straight-line from_bytes/to_bytes source specialized to the
+        class schema and exec() it into the namespace. This removes the
+        per-call field dispatch entirely; the generic methods on PLCData
+        remain in place for classes the codegen cannot express.
+        """
+        if not fields or "from_bytes" in namespace or "to_bytes" in namespace:
+            return
+
+        struct_ = namespace["_struct"]
+        scalar_names = namespace["_struct_names"]
+        bools = namespace["_bool_fields"]
+        # Every field must be covered by the struct or be a plain bool bit,
+        # otherwise the generic path stays in charge
+        if len(scalar_names) + len(bools) != len(fields):
+            return
+        if scalar_names and struct_ is None:
+            return
+
+        buffer_size = namespace["_buffer_size"]
+
+        lines = [
+            "def from_bytes(self, raw):",
+            f"    if len(raw) < {buffer_size}:",
+            "        self._from_bytes_fallback(raw)",
+            "        return",
+            "    self.from_bytes_unchecked(raw)",
+            "",
+            "def from_bytes_unchecked(self, raw):",
+        ]
+        if scalar_names:
+            targets = ", ".join(f"self._v_{name}" for name in scalar_names)
+            comma = "," if len(scalar_names) == 1 else ""
+            lines.append(f"    {targets}{comma} = _struct.unpack_from(raw)")
+        for field in bools:
+            lines.append(
+                f"    self._v_{field.name} = (raw[{field.byte_offset}] >> {field.bit_offset}) & 1"
+            )
+        lines.append("    self.notify_subscribers()")
+        lines.append("")
+        lines.append("def to_bytes(self):")
+        lines.append("    buffer = self._tx_buf")
+        if scalar_names:
+            args = ", ".join(f"self._v_{name}" for name in scalar_names)
+            lines.append(f"    _struct.pack_into(buffer, 0, {args})")
+        # One combined expression per bool byte instead of a read-modify-write
+        # per bit; bytes the struct already wrote get OR-ed, the rest assigned
+        bools_by_byte: dict = {}
+        for field in bools:
+            bools_by_byte.setdefault(field.byte_offset, []).append(field)
+        reset_bytes = set(namespace["_bool_reset_bytes"])
+        for byte_offset in sorted(bools_by_byte):
+            expression = " | ".join(
+                (
+                    f"self._v_{field.name} << {field.bit_offset}"
+                    if field.bit_offset
+                    else f"self._v_{field.name}"
+                )
+                for field in sorted(
+                    bools_by_byte[byte_offset], key=lambda field: field.bit_offset
+                )
+            )
+            operator = "=" if byte_offset in reset_bytes else "|="
+            lines.append(f"    buffer[{byte_offset}] {operator} {expression}")
+        lines.append("    return buffer")
+
+        exec_namespace = {"_struct": struct_}
+        exec("\n".join(lines), exec_namespace)
+        namespace["from_bytes"] = exec_namespace["from_bytes"]
+        namespace["from_bytes_unchecked"] = exec_namespace["from_bytes_unchecked"]
+        namespace["to_bytes"] = exec_namespace["to_bytes"]
+
 
 class PLCData(metaclass=PLCDataMeta):
     """
     Base class handling automatic serialization/deserialization for PLC fields.
     """
 
+    __slots__ = (
+        "_rev",
+        "_update_event",
+        "_loop",
+        "_tx_buf",
+        "_last_connected_mono",
+        "_last_connected_timeout",
+        "old_is_connected",
+    )
+
     def __init__(self, **initial_values):
-        self._values: Dict[str, object] = {
-            name: field.coerce(field.default) for name, field in self._fields.items()
-        }
-        self._subscribers: List[asyncio.Queue] = []
+        for field in self._fields.values():
+            setattr(self, field.slot_name, field.coerce(field.default))
+        self._rev = 0
+        # Created lazily in subscribe(): asyncio.Event() binds the current
+        # loop eagerly on Python 3.9, which would break synchronous use
+        self._update_event: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tx_buf = bytearray(self.buffer_size())
+        self._last_connected_mono: Optional[float] = None
+        self._last_connected_timeout = None
+        self.old_is_connected = False
 
         for key, value in initial_values.items():
             if key in self._fields:
@@ -47,29 +228,48 @@ class PLCData(metaclass=PLCDataMeta):
 
     IS_CONNECTED_TIMEOUT = 2  # seconds
 
-    _last_connected: Optional[datetime] = None
-
     @property
     def is_connected(self) -> bool:
-        if self._last_connected is None:
+        if self._last_connected_mono is None:
             return False
-        return (
-            datetime.now() - self._last_connected
-        ).total_seconds() <= self.IS_CONNECTED_TIMEOUT
+        return time.monotonic() - self._last_connected_mono <= self.IS_CONNECTED_TIMEOUT
 
-    def last_connected_setter(self, value):
+    @property
+    def last_connected(self) -> Optional[datetime]:
+        """Wall-clock time of the last PLC contact, for display purposes."""
+        if self._last_connected_mono is None:
+            return None
+        return datetime.now() - timedelta(
+            seconds=time.monotonic() - self._last_connected_mono
+        )
+
+    def mark_connected(self):
+        """
+        Record PLC contact. Uses time.monotonic() — no datetime allocation on
+        the hot path — and schedules the delayed status check on the cached
+        subscriber loop.
+        """
         self.old_is_connected = self.is_connected
-        self._last_connected = value
-        if self.old_is_connected != self.is_connected:
+        self._last_connected_mono = time.monotonic()
+        if not self.old_is_connected:
             self.notify_subscribers()
 
         # check connection status after timeout
-        self._last_connected_timeout = asyncio.get_event_loop().call_later(
+        loop = self._loop
+        if loop is not None:
+            try:
+                loop.call_soon_threadsafe(self._schedule_connection_timeout)
+            except RuntimeError:
+                # Loop already closed; skip the delayed status check
+                pass
+
+    def _schedule_connection_timeout(self):
+        if self._last_connected_timeout is not None:
+            self._last_connected_timeout.cancel()
+        self._last_connected_timeout = asyncio.get_running_loop().call_later(
             self.IS_CONNECTED_TIMEOUT, self._on_connection_timeout
         )
 
-    last_connected = property(lambda self: self._last_connected, last_connected_setter)
-
     def _on_connection_timeout(self):
         if self.old_is_connected != self.is_connected:
             self.notify_subscribers()
@@ -77,9 +277,7 @@ class PLCData(metaclass=PLCDataMeta):
 
     @classmethod
     def buffer_size(cls) -> int:
-        if not cls._fields:
-            return 0
-        return max(field.byte_offset + field.size for field in cls._fields.values())
+        return cls._buffer_size
 
     def set_data(self, **kwargs):
         processed = False
@@ -101,29 +299,87 @@ class PLCData(metaclass=PLCDataMeta):
         return data
 
     def from_bytes(self, raw: bytes):
-        for name, field in self._fields.items():
-            current = self._values.get(name, field.default)
-            self._values[name] = field.read(raw, current)
+        if self._struct is not None and len(raw) >= self._buffer_size:
+            self.from_bytes_unchecked(raw)
+        else:
+            self._from_bytes_fallback(raw)
+
+    def from_bytes_unchecked(self, raw: bytes):
+        """
+        Fast path assuming ``len(raw) >= buffer_size()``; skips the per-field
+        length guards. ``PLCConnection.read`` requests exactly that many
+        bytes, so the guards are dead weight in the steady state.
+        """
+        if self._struct is None:
+            self._from_bytes_fallback(raw)
+            return
+        for slot_name, value in zip(self._struct_slots, self._struct.unpack_from(raw)):
+            setattr(self, slot_name, value)
+        for field in self._bool_fields:
+            setattr(
+                self,
+                field.slot_name,
+                (raw[field.byte_offset] >> field.bit_offset) & 0x01,
+            )
         self.notify_subscribers()
 
-    def to_bytes(self) -> bytes:
-        buffer = bytearray(self.buffer_size())
-        for name, field in self._fields.items():
-            field.write(buffer, getattr(self, name))
-        return bytes(buffer)
+    def _from_bytes_fallback(self, raw: bytes):
+        # Truncated buffer or non-standard layout: the per-field path
+        # tolerates short reads by keeping the current value. The memoryview
+        # lets field readers slice without copying.
+        view = memoryview(raw)
+        for field in self._fields.values():
+            current = getattr(self, field.slot_name, field.default)
+            setattr(self, field.slot_name, field.read(view, current))
+        self.notify_subscribers()
 
-    def subscribe(self) -> asyncio.Queue:
-        q: asyncio.Queue = asyncio.Queue(maxsize=100)
-        self._subscribers.append(q)
-        return q
+    def to_bytes(self) -> bytearray:
+        # The returned buffer is owned by this instance and reused across
+        # calls; copy it if it must outlive the next to_bytes()
+        buffer = self._tx_buf
+        if self._struct is not None:
+            self._struct.pack_into(
+                buffer, 0, *(getattr(self, slot) for slot in self._struct_slots)
+            )
+            for byte_offset in self._bool_reset_bytes:
+                buffer[byte_offset] = 0
+            for field in self._bool_fields:
+                field.write(buffer, getattr(self, field.slot_name))
+        else:
+            buffer[:] = bytes(len(buffer))
+            for name, field in self._fields.items():
+                field.write(buffer, getattr(self, name))
+        return buffer
 
-    def unsubscribe(self, q: asyncio.Queue):
-        if q in self._subscribers:
-            self._subscribers.remove(q)
+    def subscribe(self) -> PLCDataSubscription:
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        if self._update_event is None:
+            self._update_event = asyncio.Event()
+        return PLCDataSubscription(self)
+
+    def unsubscribe(self, subscription: PLCDataSubscription):
+        # Subscriptions hold no shared state; kept for API symmetry
+        pass
 
     def notify_subscribers(self):
-        for q in self._subscribers:
-            try:
-                q.put_nowait(self)
-            except asyncio.QueueFull:
-                pass
+        """
+        Broadcast that the data changed. O(1) regardless of subscriber count:
+        bump the revision and wake all event waiters via the subscriber loop,
+        which keeps this safe to call from worker threads.
+        """
+        self._rev += 1
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            loop.call_soon_threadsafe(self._wake_subscribers)
+        except RuntimeError:
+            # Loop already closed; nothing left to notify
+            pass
+
+    def _wake_subscribers(self):
+        if self._update_event is None:
+            return
+        self._update_event.set()
+        self._update_event.clear()
@@ -1,4 +1,5 @@
 import struct
+from typing import Optional
 
 
 class PLCField:
@@ -6,6 +7,10 @@ class PLCField:
     Base descriptor representing a single PLC variable.
     """
 
+    # struct format character for fixed-size scalar fields; None means the
+    # field cannot take part in a class-wide precompiled struct.Struct
+    struct_format: Optional[str] = None
+
     def __init__(
         self, byte_offset: int, *, size: int, default=0, settable: bool = False
     ):
@@ -14,22 +19,24 @@ class PLCField:
         self.default = default
         self.settable = settable
         self.name: str | None = None
+        self.slot_name: str | None = None
 
     def __set_name__(self, owner, name):
         self.name = name
+        self.slot_name = "_v_" + name
 
     def __get__(self, instance, owner):
         if instance is None:
             return self
-        return instance._values.get(self.name, self.default)
+        return getattr(instance, self.slot_name)
 
     def __set__(self, instance, value):
-        instance._values[self.name] = self.coerce(value)
+        setattr(instance, self.slot_name, self.coerce(value))
 
     def coerce(self, value):
         return value
 
-    def read(self, data: bytes, current):
+    def read(self, data, current):
         return current
 
     def write(self, buffer: bytearray, value):
@@ -53,23 +60,23 @@ class PLCBoolField(PLCField):
             byte_offset, size=1, default=int(bool(default)), settable=settable
         )
         self.bit_offset = bit_offset
+        # Per-field constant; precomputed so write doesn't rebuild it
+        self._clear_mask = ~(1 << bit_offset) & 0xFF
 
     def coerce(self, value):
         return 1 if bool(value) else 0
 
-    def read(self, data: bytes, current):
+    def read(self, data, current):
         if len(data) <= self.byte_offset:
             return current
         byte_value = data[self.byte_offset]
         return (byte_value >> self.bit_offset) & 0x01
 
     def write(self, buffer: bytearray, value):
-        value = self.coerce(value)
-        mask = 1 << self.bit_offset
-        if value:
-            buffer[self.byte_offset] |= mask
-        else:
-            buffer[self.byte_offset] &= (~mask) & 0xFF
+        # Branchless clear-then-set avoids a data-dependent branch on value
+        buffer[self.byte_offset] = (buffer[self.byte_offset] & self._clear_mask) | (
+            self.coerce(value) << self.bit_offset
+        )
 
 
 class PLCWordField(PLCField):
@@ -87,6 +94,7 @@ class PLCWordField(PLCField):
     ):
         super().__init__(byte_offset, size=2, default=int(default), settable=settable)
         self.signed = signed
+        self.struct_format = "h" if signed else "H"
 
     def _clamp(self, value: int) -> int:
         value = int(value)
@@ -97,11 +105,12 @@ class PLCWordField(PLCField):
     def coerce(self, value):
         return self._clamp(value)
 
-    def read(self, data: bytes, current):
-        slice_ = data[self.byte_offset : self.byte_offset + self.size]
-        if len(slice_) < self.size:
+    def read(self, data, current):
+        end = self.byte_offset + self.size
+        if len(data) < end:
             return current
-        return int.from_bytes(slice_, byteorder="big", signed=self.signed)
+        # With a memoryview the slice is a view, not a copy
+        return int.from_bytes(data[self.byte_offset : end], "big", signed=self.signed)
 
     def write(self, buffer: bytearray, value):
         value = self.coerce(value)
@@ -115,6 +124,11 @@ class PLCRealField(PLCField):
     Field representing a 32-bit IEEE-754 floating point value (REAL).
     """
 
+    struct_format = "f"
+    # Precompiled once for all REAL fields; avoids re-parsing the format
+    # string on every read/write
+    _codec = struct.Struct(">f")
+
     def __init__(
         self, byte_offset: int, *, default: float = 0.0, settable: bool = False
     ):
@@ -123,16 +137,13 @@ class PLCRealField(PLCField):
     def coerce(self, value):
         return float(value)
 
-    def read(self, data: bytes, current):
-        slice_ = data[self.byte_offset : self.byte_offset + self.size]
-        if len(slice_) < self.size:
-            return current
+    def read(self, data, current):
         try:
-            return struct.unpack(">f", slice_)[0]
+            # unpack_from reads in place and raises on a short buffer
+            return self._codec.unpack_from(data, self.byte_offset)[0]
         except struct.error:
             return current
 
     def write(self, buffer: bytearray, value):
-        buffer[self.byte_offset : self.byte_offset + self.size] = struct.pack(
-            ">f", float(value)
-        )
+        # pack_into writes in place; no intermediate bytes allocation
+        self._codec.pack_into(buffer, self.byte_offset, float(value))
@@ -0,0 +1,124 @@
+import asyncio
+import logging
+
+from .connection import PLCConnection
+
+logger = logging.getLogger(__name__)
+
+
+class PLCConnectionPool:
+    """
+    Pool of pre-connected PLCConnections to a single PLC.
+
+    One connection serializes all requests on its socket, but an S7-1500
+    accepts up to 3 concurrent in-flight requests; keeping that many
+    established connections lets reads/writes of different DBs overlap
+    instead of queueing. Use ``size=1`` for controllers that only serve one
+    request at a time (e.g. S7-1200).
+    """
+
+    def __init__(
+        self,
+        ip_address,
+        *,
+        size: int = 3,
+        db_number=1,
+        rack=0,
+        slot=1,
+        port=102,
+        connect_timeout: float = 1.5,
+    ):
+        self.ip_address = ip_address
+        self.size = int(size)
+        self._connections = [
+            PLCConnection(
+                ip_address,
+                db_number=db_number,
+                rack=rack,
+                slot=slot,
+                port=port,
+                connect_timeout=connect_timeout,
+            )
+            for _ in range(self.size)
+        ]
+        # Created and seeded lazily: asyncio.Queue() binds the current loop
+        # eagerly on Python 3.9, and pools are naturally built before the
+        # loop starts
+        self._queue = None
+        self._keepalive_task: asyncio.Task | None = None
+
+    def _ensure_queue(self) -> asyncio.Queue:
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+            for connection in self._connections:
+                self._queue.put_nowait(connection)
+        return self._queue
+
+    async def acquire(self) -> PLCConnection:
+        """Take a connection out of the pool, waiting if all are in use."""
+        return await self._ensure_queue().get()
+
+    def release(self, connection: PLCConnection):
+        """Return a previously acquired connection to the pool."""
+        self._queue.put_nowait(connection)
+
+    async def read(self, data_store, db_number=None) -> bool:
+        connection = await self.acquire()
+        try:
+            return await connection.aread(data_store, db_number)
+        finally:
+            self.release(connection)
+
+    async def write(self, data_store, db_number=None) -> bool:
+        connection = await self.acquire()
+        try:
+            return await connection.awrite(data_store, db_number)
+        finally:
+            self.release(connection)
+
+    async def warm_up(self) -> bool:
+        """
+        Dial every connection up front so the first reads don't pay the
+        handshake, and start the keepalive task. Returns True when all
+        connections came up.
+        """
+        self._ensure_queue()
+        results = await asyncio.gather(
+            *(connection.aconnect() for connection in self._connections)
+        )
+        self.start_keepalive()
+        return all(results)
+
+    def start_keepalive(self, interval: float = 30.0):
+        """Re-dial idle connections that dropped, every ``interval`` seconds."""
+        if self._keepalive_task is None or self._keepalive_task.done():
+            self._keepalive_task = asyncio.ensure_future(self._keepalive_loop(interval))
+
+    async def _keepalive_loop(self, interval: float):
+        queue = self._ensure_queue()
+        while True:
+            await asyncio.sleep(interval)
+            # Only touch connections sitting idle in the pool; ones in use
+            # prove their own liveness
+            for _ in range(self.size):
+                try:
+                    connection = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                try:
+                    await connection.aconnect()
+                except Exception as e:
+                    logger.error(f"Error keeping PLC connection warm: {e}")
+                finally:
+                    self.release(connection)
+
+    async def close(self):
+        """Stop the keepalive task and disconnect every connection."""
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel()
+            self._keepalive_task = None
+        for connection in self._connections:
+            try:
+                await asyncio.to_thread(connection.client.disconnect)
+            except Exception as e:
+                logger.error(f"Error disconnecting pooled PLC connection: {e}")